@@ -9,13 +9,33 @@ import time
 import sys
 import shutil
 from datetime import datetime
-from colorama import init, Fore, Style
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 import re
-import platform
-import configparser
 import threading
+import struct
+import stat
+import queue
+import shlex
+import functools
+import io
+import math
+
+class _NoColor:
+    """Stand-in for colorama's Fore/Style that yields no escape codes."""
+
+    def __getattr__(self, name):
+        return ""
+
+if sys.stdout is not None and sys.stdout.isatty():
+    from colorama import init, Fore, Style
+    init()
+else:
+    # Redirected output gets plain text and never loads colorama
+    Fore = Style = _NoColor()
 
-init()
+_PROGRESS_PREFIX = f"\r{Fore.CYAN}"
+_RESET = Style.RESET_ALL
 
 if getattr(sys, 'frozen', False):
     CURRENT_DIR = os.path.dirname(sys.executable)
@@ -33,44 +53,235 @@ if not os.path.exists(PLATFORM_TOOLS_PATH):
     input("Press Enter to exit...")
     sys.exit(1)
 
+# adb needs no console of its own; on Windows this skips allocating one per call
+_SUBPROCESS_KW = {'creationflags': subprocess.CREATE_NO_WINDOW} if sys.platform.startswith('win') else {}
+
+_KB, _GB = 1024, 1024 ** 3
+
+DEFAULT_PARALLEL_PULLS = 4
+ADB_DEVICE_ATTEMPTS = 3
+PROGRESS_INTERVAL = 0.2
+REDRAW_INTERVAL = 1.0
+SCAN_INTERVAL = 1.0
+RMTREE_WORKERS = 8
+MERGE_LIST_TIMEOUT = 600
+MAX_PULL_ARGS_LENGTH = 8000
+PULL_TERMINATE_TIMEOUT = 5
+ADB_COMPRESSION_MIN_VERSION = (31, 0, 0)  # first release with pull -z/-Z
+RATE_TIME_CONSTANT = 5.0
+
+_ADB_VERSION_RE = re.compile(r"Version (\d+\.\d+\.\d+)")
+_ADB_PROGRESS_RE = re.compile(rb"\[\s*(\d+)%\]\s+(.+?)(?::\s*\d+%)?$")
+_ADB_PULL_SUMMARY_RE = re.compile(rb"(\d+) files? pulled.*\((\d+) bytes in")
+_GETPROP_LINE_RE = re.compile(r"^\[([^\]]+)\]: \[(.*)\]\s*$", re.MULTILINE)
+_ERR_RE = re.compile(r"Permission denied|failed|cannot", re.IGNORECASE)
+_CONFIG_LINE_RE = re.compile(r"^\s*([A-Za-z_]\w*)\s*[=:]\s*(.*?)\s*$", re.MULTILINE)
+
+ERROR_LOG_BATCH_LINES = 100
+ERROR_LOG_FLUSH_INTERVAL = 1.0
+
+def run_adb(*args, timeout=10):
+    """Run a one-shot adb command and capture its output as text.
+
+    Raises subprocess.CalledProcessError if adb exits with an error.
+    """
+    return subprocess.run(
+        [ADB_PATH, *args],
+        capture_output=True,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+        check=True,
+        timeout=timeout,
+        **_SUBPROCESS_KW
+    )
+
+class AdbShell:
+    """A long-lived `adb shell` session for short probe commands.
+
+    Each command is written to the shell's stdin followed by an end marker
+    carrying its exit status, so every probe after the first reuses the same
+    adb process and USB connection instead of spawning a new one. The process
+    is started on first use; using the session as a context manager closes it
+    on exit, after which it refuses further commands.
+    """
+
+    END_MARKER = "__ANDROID_ARCHIVER_END__"
+
+    def __init__(self, device_name):
+        self.device_name = device_name
+        self._process = None
+        self._lines = None
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def _start(self):
+        self._process = subprocess.Popen(
+            [ADB_PATH, "-s", self.device_name, "shell"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            **_SUBPROCESS_KW
+        )
+        self._lines = queue.Queue()
+        threading.Thread(
+            target=self._read_thread,
+            args=(self._process.stdout, self._lines),
+            daemon=True
+        ).start()
+
+    @staticmethod
+    def _read_thread(stdout_stream, lines):
+        for line in iter(stdout_stream.readline, b''):
+            lines.put(line.decode("utf-8", "replace").rstrip("\r\n"))
+        lines.put(None)
+
+    def run(self, command, timeout=10):
+        """Run a command in the shell.
+
+        The timeout also covers waiting for a command already running on the
+        session to finish.
+
+        Returns: (output, exit_code)
+        """
+        deadline = time.time() + timeout
+        if not self._lock.acquire(timeout=timeout):
+            raise subprocess.TimeoutExpired(command, timeout)
+        try:
+            if self._closed:
+                raise RuntimeError("adb shell session is closed")
+            if self._process is None or self._process.poll() is not None:
+                self._start()
+            script = f"({command}) </dev/null; echo \"{self.END_MARKER}$?\"\n"
+            try:
+                self._process.stdin.write(script.encode("utf-8"))
+                self._process.stdin.flush()
+            except OSError:
+                self._close()
+                raise
+
+            output = []
+            while True:
+                try:
+                    line = self._lines.get(timeout=max(deadline - time.time(), 0))
+                except queue.Empty:
+                    self._close()
+                    raise subprocess.TimeoutExpired(command, timeout)
+                if line is None:
+                    self._close()
+                    raise RuntimeError("adb shell session closed unexpectedly")
+                head, marker, exit_code = line.rpartition(self.END_MARKER)
+                if marker:
+                    if head:
+                        output.append(head)
+                    return "\n".join(output), int(exit_code or 1)
+                output.append(line)
+        finally:
+            self._lock.release()
+
+    def close(self):
+        """Terminate the shell session, failing any command still running on it."""
+        self._closed = True
+        process, lines = self._process, self._lines
+        if process is not None and process.poll() is None:
+            process.terminate()
+        if lines is not None:
+            # Wake a command waiting for output even if the pipe stays open a moment longer
+            lines.put(None)
+        with self._lock:
+            self._close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _close(self):
+        if self._process is not None:
+            try:
+                self._process.stdin.close()
+            except OSError:
+                pass
+            if self._process.poll() is None:
+                self._process.terminate()
+            self._process = None
+
+_ADB_SHELLS = {}
+
+def get_adb_shell(device_name):
+    """Return the shared shell session for a device, creating it on first use."""
+    if device_name not in _ADB_SHELLS:
+        _ADB_SHELLS[device_name] = AdbShell(device_name)
+    return _ADB_SHELLS[device_name]
+
+DEVICE_INFO_PROPS = (
+    "ro.product.manufacturer",
+    "ro.product.model",
+    "ro.build.version.release",
+    "ro.build.display.id",
+)
+
+_DEVICE_PROPS = {}
+
+def get_device_props(device_name, props=DEVICE_INFO_PROPS):
+    """Read system properties of a device with a single shell call.
+
+    Only the requested properties are queried, each echoed as a getprop-style
+    "[name]: [value]" line. Successful results are cached per device and
+    property; a failed query is not cached so it can be retried.
+
+    Returns: dict of property name to value (missing entries if the query failed)
+    """
+    cached = _DEVICE_PROPS.setdefault(device_name, {})
+    missing = [prop for prop in props if prop not in cached]
+    if missing:
+        command = "; ".join(f'echo "[{prop}]: [$(getprop {prop})]"' for prop in missing)
+        try:
+            output, exit_code = get_adb_shell(device_name).run(command, timeout=5)
+        except Exception:
+            return cached
+        if exit_code == 0:
+            cached.update(_GETPROP_LINE_RE.findall(output))
+    return cached
+
+def get_device_prop(device_name, prop):
+    """Read one system property, reusing the per-device cache.
+
+    Read-only properties do not change while the device is connected, so a
+    property is only fetched from the device the first time it is asked for.
+    """
+    return get_device_props(device_name, (prop,)).get(prop) or "Unknown"
+
+def _parse_devices(output):
+    """Return the device lines from `adb devices` output."""
+    return [line for line in output.splitlines() if line.strip() and "List of devices attached" not in line]
+
 def get_android_device_name():
     """Get the name of the connected Android device using adb and display device info."""
     try:
-        result = subprocess.run(
-            [ADB_PATH, "devices"],
-            capture_output=True,
-            text=True,
-            encoding="utf-8",
-            check=True,
-            timeout=10
-        )
+        device_lines = []
+        for attempt in range(ADB_DEVICE_ATTEMPTS):
+            result = run_adb("devices")
+            device_lines = _parse_devices(result.stdout)
+            if device_lines or attempt == ADB_DEVICE_ATTEMPTS - 1:
+                break
 
-        devices = result.stdout.splitlines()
-        device_lines = [line for line in devices if line.strip() and "List of devices attached" not in line]
+            if attempt == 0:
+                print(f"{Fore.YELLOW}No devices found. Restarting ADB server...{Style.RESET_ALL}")
+            run_adb("kill-server")
+            run_adb("start-server", timeout=30)
+            # A freshly started server may not have enumerated USB devices yet
+            time.sleep(0.5 * 2 ** attempt)
 
         if not device_lines:
-            print(f"{Fore.YELLOW}No devices found. Restarting ADB server...{Style.RESET_ALL}")
-            subprocess.run([ADB_PATH, "kill-server"], check=True)
-            subprocess.run([ADB_PATH, "start-server"], check=True)
-            result = subprocess.run(
-                [ADB_PATH, "devices"],
-                capture_output=True,
-                text=True,
-                encoding="utf-8",
-                check=True,
-                timeout=10
-            )
-            devices = result.stdout.splitlines()
-            device_lines = [line for line in devices if line.strip() and "List of devices attached" not in line]
-
-            if not device_lines:
-                print(f"{Fore.RED}No Android device found. Please ensure:{Style.RESET_ALL}")
-                print(f"1. USB debugging is enabled in Developer Options")
-                print(f"2. Device is set to 'File Transfer' mode")
-                print(f"3. Appropriate USB drivers are installed")
-                print("")
-                input("Press Enter to exit...")
-                return None
+            print(f"{Fore.RED}No Android device found. Please ensure:{Style.RESET_ALL}")
+            print(f"1. USB debugging is enabled in Developer Options")
+            print(f"2. Device is set to 'File Transfer' mode")
+            print(f"3. Appropriate USB drivers are installed")
+            print("")
+            input("Press Enter to exit...")
+            return None
 
         if len(device_lines) > 1:
             print(f"{Fore.YELLOW}Multiple devices detected. Please select a device:{Style.RESET_ALL}")
@@ -95,27 +306,17 @@ def get_android_device_name():
         else:
             device_name = device_lines[0].split("\t")[0]
 
-        def get_device_prop(prop):
-            try:
-                result = subprocess.run(
-                    [ADB_PATH, "-s", device_name, "shell", f"getprop {prop}"],
-                    capture_output=True,
-                    text=True,
-                    encoding="utf-8",
-                    check=True,
-                    timeout=5
-                )
-                return result.stdout.strip()
-            except Exception:
-                return "Unknown"
+        get_device_props(device_name)
 
         print(f"\n{Fore.GREEN}Device Information:{Style.RESET_ALL}")
-        print(f" - {Fore.WHITE}Manufacturer: {Fore.GREEN}{get_device_prop('ro.product.manufacturer')}{Style.RESET_ALL}")
-        print(f" - {Fore.WHITE}Model: {Fore.GREEN}{get_device_prop('ro.product.model')}{Style.RESET_ALL}")
-        print(f" - {Fore.WHITE}Android Version: {Fore.GREEN}{get_device_prop('ro.build.version.release')}{Style.RESET_ALL}")
-        print(f" - {Fore.WHITE}Build Number: {Fore.GREEN}{get_device_prop('ro.build.display.id')}{Style.RESET_ALL}")
+        print(f" - {Fore.WHITE}Manufacturer: {Fore.GREEN}{get_device_prop(device_name, 'ro.product.manufacturer')}{Style.RESET_ALL}")
+        print(f" - {Fore.WHITE}Model: {Fore.GREEN}{get_device_prop(device_name, 'ro.product.model')}{Style.RESET_ALL}")
+        print(f" - {Fore.WHITE}Android Version: {Fore.GREEN}{get_device_prop(device_name, 'ro.build.version.release')}{Style.RESET_ALL}")
+        print(f" - {Fore.WHITE}Build Number: {Fore.GREEN}{get_device_prop(device_name, 'ro.build.display.id')}{Style.RESET_ALL}")
         print(f" - {Fore.WHITE}Serial Number: {Fore.GREEN}{device_name}{Style.RESET_ALL}")
 
+        prefetch_device_info(device_name)
+
         return device_name
 
     except Exception as e:
@@ -123,30 +324,8 @@ def get_android_device_name():
         input("Press Enter to exit...")
         return None
 
-def select_backup_location(config):
-    """Select the backup location using simple console prompts."""
-    print("-" * 60)
-    
-    user_home = os.path.expanduser("~")
-
-    if config.has_option('DEFAULT', 'backup_location'):
-        default_backup_dir = config.get('DEFAULT', 'backup_location')
-    else:
-        default_backup_dir = os.path.join(user_home, "Documents", "AndroidBackup")
-
-    print(f"\n{Fore.GREEN}Backup Location:{Style.RESET_ALL}")
-    print(f"Default: {Fore.CYAN}{default_backup_dir}{Style.RESET_ALL}")
-    print("")
-    choice = input("Press Enter to use default, or type a custom path: ").strip()
-
-    if choice:
-        backup_location = choice
-    else:
-        backup_location = default_backup_dir
-
-    print(f"{Fore.CYAN}Using: {backup_location}{Style.RESET_ALL}")
-
-    critical_dirs = [
+_CRITICAL_DIRS = frozenset(
+    os.path.normcase(os.path.normpath(critical_dir)) for critical_dir in (
         os.path.expanduser("~"),
         os.path.expanduser("~/Documents"),
         os.path.expanduser("~/Downloads"),
@@ -157,55 +336,140 @@ def select_backup_location(config):
         os.path.expandvars("%ProgramFiles(x86)%"),
         os.path.expandvars("%LocalAppData%"),
         os.path.expandvars("%AppData%")
-    ]
+    )
+)
 
-    backup_location = os.path.normpath(backup_location)
-    if any(os.path.normpath(critical_dir) == backup_location
-           for critical_dir in critical_dirs):
-        print(f"{Fore.RED}Error: Cannot use a critical system directory as backup location.{Style.RESET_ALL}")
-        return select_backup_location(config)
+def select_backup_location(config):
+    """Select the backup location using simple console prompts."""
+    user_home = os.path.expanduser("~")
 
-    if backup_location.startswith('\\\\'):
-        print(f"{Fore.YELLOW}Warning: Network drive selected. Performance may be slower.{Style.RESET_ALL}")
-        confirm = input("Continue with network backup? (y/n): ").lower()
-        if confirm != 'y':
-            return select_backup_location(config)
+    default_backup_dir = config.get('backup_location') or os.path.join(user_home, "Documents", "AndroidBackup")
 
-    try:
-        if platform.system() == 'Windows':
-            import ctypes
-            free_bytes = ctypes.c_ulonglong(0)
-            ctypes.windll.kernel32.GetDiskFreeSpaceExW(
-                ctypes.c_wchar_p(backup_location),
-                None,
-                None,
-                ctypes.pointer(free_bytes)
-            )
-            free_space = free_bytes.value
+    while True:
+        print("-" * 60)
+
+        print(f"\n{Fore.GREEN}Backup Location:{Style.RESET_ALL}")
+        print(f"Default: {Fore.CYAN}{default_backup_dir}{Style.RESET_ALL}")
+        print("")
+        choice = input("Press Enter to use default, or type a custom path: ").strip()
+
+        if choice:
+            backup_location = choice
         else:
-            stat = os.statvfs(backup_location)
-            free_space = stat.f_bavail * stat.f_frsize
+            backup_location = default_backup_dir
+
+        print(f"{Fore.CYAN}Using: {backup_location}{Style.RESET_ALL}")
 
-        if free_space < 10 * 1024**3:
-            print(f"{Fore.YELLOW}Warning: Less than 10GB free space ({format_size(free_space)}) in backup location.{Style.RESET_ALL}")
-            confirm = input("Continue anyway? (y/n): ").lower()
+        backup_location = os.path.normpath(backup_location)
+        if os.path.normcase(backup_location) in _CRITICAL_DIRS:
+            print(f"{Fore.RED}Error: Cannot use a critical system directory as backup location.{Style.RESET_ALL}")
+            continue
+
+        if backup_location.startswith('\\\\'):
+            print(f"{Fore.YELLOW}Warning: Network drive selected. Performance may be slower.{Style.RESET_ALL}")
+            confirm = input("Continue with network backup? (y/n): ").lower()
             if confirm != 'y':
-                return select_backup_location(config)
-    except Exception as e:
-        print(f"{Fore.YELLOW}Warning: Could not verify free space: {e}{Style.RESET_ALL}")
+                continue
+
+        try:
+            # The backup folder may not exist yet; measure the drive it will be created on
+            existing_path = backup_location
+            while not os.path.exists(existing_path) and os.path.dirname(existing_path) != existing_path:
+                existing_path = os.path.dirname(existing_path)
+            free_space = shutil.disk_usage(existing_path).free
+
+            if free_space < 10 * _GB:
+                print(f"{Fore.YELLOW}Warning: Less than 10GB free space ({format_size(free_space)}) in backup location.{Style.RESET_ALL}")
+                confirm = input("Continue anyway? (y/n): ").lower()
+                if confirm != 'y':
+                    continue
+        except Exception as e:
+            print(f"{Fore.YELLOW}Warning: Could not verify free space: {e}{Style.RESET_ALL}")
+
+        return backup_location
+
+def _unlink_quietly(path):
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+def _is_dir_link(entry):
+    """True for directory symlinks and Windows junctions, which must not be descended into."""
+    if entry.is_symlink():
+        return True
+    attributes = getattr(entry.stat(follow_symlinks=False), 'st_file_attributes', 0)
+    return bool(attributes & stat.FILE_ATTRIBUTE_REPARSE_POINT)
+
+def _parallel_rmtree(path):
+    directories = []
+    dir_links = []
+    pending = [path]
+    with ThreadPoolExecutor(max_workers=RMTREE_WORKERS) as executor:
+        unlinks = []
+        while pending:
+            directory = pending.pop()
+            directories.append(directory)
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if not entry.is_dir(follow_symlinks=False):
+                        unlinks.append(executor.submit(_unlink_quietly, entry.path))
+                    elif _is_dir_link(entry):
+                        dir_links.append(entry.path)
+                    else:
+                        pending.append(entry.path)
+        for unlink in unlinks:
+            unlink.result()
+
+    for link in dir_links:
+        os.rmdir(link)
+    # Parents are listed before their subdirectories, so reversed order empties children first
+    for directory in reversed(directories):
+        try:
+            os.rmdir(directory)
+        except FileNotFoundError:
+            pass
 
-    return backup_location
+def fast_rmtree(path):
+    """Delete a directory tree, unlinking its files on a thread pool.
+
+    The tree is walked once; every file is unlinked on one of RMTREE_WORKERS
+    threads (the syscalls release the GIL) and the emptied directories are
+    then removed bottom-up. Anything left after a failure is handed to
+    shutil.rmtree, which raises the error if it cannot finish either.
+    """
+    try:
+        _parallel_rmtree(path)
+    except OSError:
+        if os.path.lexists(path):
+            shutil.rmtree(path)
 
 def check_existing_backup(backup_location):
-    """Check if backup location already has files and ask user what to do."""
+    """Check if backup location already has files and ask user what to do.
+
+    Returns: (proceed, merge) where merge is True if the user chose to merge
+    with the existing backup
+    """
     if os.path.exists(backup_location):
         files_in_dir = os.listdir(backup_location)
         if files_in_dir:
             print(f"\n{Fore.YELLOW}Warning: Backup location already contains files.{Style.RESET_ALL}")
             print(f"Found {len(files_in_dir)} items in: {backup_location}")
+            previous_backup = None
+            if "backup_completed.txt" in files_in_dir:
+                try:
+                    with open(os.path.join(backup_location, "backup_completed.txt")) as f:
+                        previous_backup = f.readline().strip()
+                except OSError:
+                    pass
+            if previous_backup:
+                print(f"Previous backup: {previous_backup}")
             print("")
             print("Options:")
-            print("1. Merge with existing backup (add new files)")
+            if previous_backup:
+                print("1. Update existing backup (only pull new or changed files)")
+            else:
+                print("1. Merge with existing backup (add new files)")
             print("2. Delete existing backup and start fresh")
             print("3. Cancel and choose different location")
             print("")
@@ -215,40 +479,37 @@ def check_existing_backup(backup_location):
                 confirm = input(f"Delete all existing files? This cannot be undone! (yes/no): ").lower()
                 if confirm == "yes":
                     try:
-                        shutil.rmtree(backup_location)
+                        fast_rmtree(backup_location)
                         os.makedirs(backup_location)
                         print(f"Existing backup deleted.")
-                        return True
+                        return True, False
                     except Exception as e:
                         print(f"{Fore.RED}Failed to delete existing backup: {e}{Style.RESET_ALL}")
-                        return False
+                        return False, False
                 else:
                     print(f"{Fore.YELLOW}Deletion cancelled.{Style.RESET_ALL}")
-                    return False
+                    return False, False
             elif choice == "3":
-                return False
+                return False, False
             elif choice == "1":
                 print(f"Will merge with existing backup.")
-                return True
+                return True, True
             else:
                 print(f"{Fore.RED}Invalid choice.{Style.RESET_ALL}")
-                return False
-    return True
+                return False, False
+    return True, False
+
+_ADB_VERSION = None
 
 def check_adb_version():
     """Check if ADB version is compatible."""
+    global _ADB_VERSION
     try:
-        result = subprocess.run(
-            [ADB_PATH, "version"],
-            capture_output=True,
-            text=True,
-            encoding="utf-8",
-            check=True,
-            timeout=10
-        )
-        version_match = re.search(r"Version (\d+\.\d+\.\d+)", result.stdout)
+        result = run_adb("version")
+        version_match = _ADB_VERSION_RE.search(result.stdout)
         if version_match:
             version = version_match.group(1)
+            _ADB_VERSION = tuple(int(part) for part in version.split("."))
             print(f"{Fore.CYAN}ADB Version: {version}{Style.RESET_ALL}")
             return True
         return False
@@ -259,16 +520,9 @@ def check_adb_version():
 def check_device_compatibility(device_name):
     """Check if device is compatible and accessible."""
     try:
-        result = subprocess.run(
-            [ADB_PATH, "-s", device_name, "get-state"],
-            capture_output=True,
-            text=True,
-            encoding="utf-8",
-            check=True,
-            timeout=10
-        )
-        if "device" not in result.stdout.lower():
-            print(f"{Fore.RED}Device is not in proper state: {result.stdout}{Style.RESET_ALL}")
+        output, _ = get_adb_shell(device_name).run("getprop sys.boot_completed", timeout=10)
+        if output.strip() != "1":
+            print(f"{Fore.RED}Device is not in proper state: not fully booted{Style.RESET_ALL}")
             return False
         return True
     except Exception as e:
@@ -280,17 +534,109 @@ def cleanup_interrupted_backup(backup_location, dir_created_by_us):
     if dir_created_by_us and os.path.exists(backup_location):
         print(f"{Fore.YELLOW}Cleaning up interrupted backup...{Style.RESET_ALL}")
         try:
-            shutil.rmtree(backup_location)
+            fast_rmtree(backup_location)
             print(f"{Fore.GREEN}Cleanup completed.{Style.RESET_ALL}")
         except Exception as e:
             print(f"{Fore.RED}Cleanup failed: {e}{Style.RESET_ALL}")
     else:
         print(f"{Fore.YELLOW}Backup directory not cleaned (may contain existing files).{Style.RESET_ALL}")
 
+_SDCARD_LISTINGS = {}
+_SDCARD_SIZES = {}
+_PREFETCH_SHELLS = {}
+
+def prefetch_device_info(device_name):
+    """Start listing /sdcard and measuring a full backup while the user answers prompts.
+
+    The prefetch runs on its own shell session, so a slow du does not hold
+    up the probes made on the shared one meanwhile.
+    """
+    shell = AdbShell(device_name)
+    _PREFETCH_SHELLS[device_name] = shell
+    executor = ThreadPoolExecutor(max_workers=1)
+    _SDCARD_LISTINGS[device_name] = executor.submit(list_remote_dir, device_name, "/sdcard", shell)
+    _SDCARD_SIZES[device_name] = executor.submit(measure_full_backup_size, device_name, shell)
+    executor.submit(shell.close)
+    executor.shutdown(wait=False)
+
+def cancel_prefetch(device_name):
+    """Stop measuring a full backup that is no longer going to be needed."""
+    shell = _PREFETCH_SHELLS.pop(device_name, None)
+    if shell is not None:
+        _SDCARD_SIZES.pop(device_name, None)
+        shell.close()
+
+def list_remote_dir(device_name, remote_path, shell=None):
+    """List the entries of a directory on the device, including hidden ones.
+
+    Returns an empty list if the path is not a directory or cannot be read.
+    """
+    quoted_path = shlex.quote(remote_path.rstrip('/') + '/')
+    output, exit_code = (shell or get_adb_shell(device_name)).run(f"ls -1a {quoted_path} 2>/dev/null", timeout=10)
+    if exit_code != 0:
+        return []
+    return [
+        entry for entry in (line.strip() for line in output.splitlines())
+        if entry and entry not in ('.', '..')
+    ]
+
+def list_sdcard(device_name):
+    """List the top-level entries of /sdcard, including hidden ones."""
+    if device_name in _SDCARD_LISTINGS:
+        try:
+            return _SDCARD_LISTINGS[device_name].result()
+        except Exception:
+            # The prefetch was cancelled or failed; list again on the shared session
+            pass
+    return list_remote_dir(device_name, "/sdcard")
+
+def _du_total(device_name, quoted_paths, shell=None):
+    """Sum du's per-path totals for the given (already quoted) paths.
+
+    Uses exact byte counts (du -sb) where the device's du supports them and
+    falls back to kilobyte blocks (du -sk) otherwise.
+    """
+    for du_flags, multiplier in (("-sb", 1), ("-sk", _KB)):
+        try:
+            output, _ = (shell or get_adb_shell(device_name)).run(
+                f"du {du_flags} {quoted_paths} 2>/dev/null",
+                timeout=120
+            )
+        except Exception:
+            continue
+        sizes = [int(fields[0]) for fields in (line.split() for line in output.splitlines())
+                 if fields and fields[0].isdigit()]
+        if sizes:
+            return sum(sizes) * multiplier
+    return None
+
+def measure_remote_size(device_name, remote_path):
+    """Measure a directory on the device with du.
+
+    Returns: size in bytes, or None if du gave no usable total
+    """
+    return _du_total(device_name, shlex.quote(remote_path.rstrip('/') + '/'))
+
+def measure_full_backup_size(device_name, shell=None):
+    """Measure what a full backup pulls: every top-level /sdcard entry except Android.
+
+    Returns: size in bytes, or None if /sdcard could not be listed or measured
+    """
+    try:
+        entries = [entry for entry in list_sdcard(device_name) if entry != "Android"]
+    except Exception:
+        return None
+    if not entries:
+        return None
+    return _du_total(device_name, " ".join(shlex.quote(f"/sdcard/{entry}") for entry in entries), shell)
+
 def get_backup_parameters(device_name):
     """Prompt user for backup type and return source path.
     
-    Returns: (source_path, exclude_android_flag)
+    Returns: (source_path, exclude_android_flag, source_verified)
+
+    The source is verified when it comes from the /sdcard listing (partial)
+    or is /sdcard itself (full), so the transfer can skip re-checking it.
     """
     print("-" * 60)
     
@@ -302,23 +648,16 @@ def get_backup_parameters(device_name):
 
     if backup_type == "2":
         try:
-            result = subprocess.run(
-                [ADB_PATH, "-s", device_name, "shell", "ls -1 /sdcard"],
-                capture_output=True,
-                text=True,
-                encoding="utf-8",
-                timeout=10
-            )
             folders = [
-                f.strip() for f in result.stdout.splitlines()
-                if f.strip()
-                and not f.startswith(('.', 'Android'))
+                f for f in list_sdcard(device_name)
+                if not f.startswith(('.', 'Android'))
             ]
+            cancel_prefetch(device_name)
 
             if not folders:
                 print(f"{Fore.RED}No accessible folders found{Style.RESET_ALL}")
                 input("Press Enter to exit...")
-                return None, False
+                return None, False, False
 
             print(f"\n{Fore.GREEN}Available folders in /sdcard:{Style.RESET_ALL}")
             for i, folder in enumerate(folders, 1):
@@ -330,32 +669,51 @@ def get_backup_parameters(device_name):
                 folder_index = int(selection) - 1
                 if 0 <= folder_index < len(folders):
                     source_path = f"/sdcard/{folders[folder_index]}"
-                    return source_path, False
+                    return source_path, False, True
                 else:
                     print(f"{Fore.RED}Invalid selection{Style.RESET_ALL}")
                     input("Press Enter to exit...")
-                    return None, False
+                    return None, False, False
             except ValueError:
                 print(f"{Fore.RED}Please enter a valid number{Style.RESET_ALL}")
                 input("Press Enter to exit...")
-                return None, False
+                return None, False, False
 
         except Exception as e:
             print(f"{Fore.RED}Error listing folders: {e}{Style.RESET_ALL}")
             input("Press Enter to exit...")
-            return None, False
+            return None, False, False
     else:
         source_path = "/sdcard"
-        return source_path, True
+        return source_path, True, True
 
-    return None, False
+    return None, False, False
+
+def estimate_backup_size(device_name, source_path):
+    """Measure the size of the backup source on the device.
+
+    Falls back to prompting the user for an estimate in GB if du fails.
 
-def estimate_backup_size():
-    """Prompt user to estimate backup size in GB.
-    
     Returns: estimated size in bytes
     """
     print("-" * 60)
+
+    if source_path == "/sdcard" and device_name in _SDCARD_SIZES:
+        prefetched_size = _SDCARD_SIZES[device_name]
+        if not prefetched_size.done():
+            print(f"\n{Fore.CYAN}Measuring {source_path} on device...{Style.RESET_ALL}")
+        measured_size = prefetched_size.result()
+    elif source_path == "/sdcard":
+        print(f"\n{Fore.CYAN}Measuring {source_path} on device...{Style.RESET_ALL}")
+        measured_size = measure_full_backup_size(device_name)
+    else:
+        print(f"\n{Fore.CYAN}Measuring {source_path} on device...{Style.RESET_ALL}")
+        measured_size = measure_remote_size(device_name, source_path)
+
+    if measured_size:
+        print(f"\n{Fore.GREEN}Backup Size:{Style.RESET_ALL} {format_size(measured_size)} (measured on device)")
+        print("")
+        return measured_size
     
     print(f"\n{Fore.GREEN}Estimated Backup Size:{Style.RESET_ALL}")
     print("Please estimate the total size of your backup in GB")
@@ -369,108 +727,823 @@ def estimate_backup_size():
             if estimated_gb <= 0:
                 print(f"{Fore.RED}Size must be positive{Style.RESET_ALL}")
                 continue
-            return estimated_gb * 1024**3
+            return estimated_gb * _GB
         except ValueError:
             print(f"{Fore.RED}Please enter a valid number{Style.RESET_ALL}")
 
 def log_errors_thread(stderr_stream, log_file):
-    """Background thread to capture stderr and log errors."""
+    """Background thread to capture stderr and log errors.
+
+    Matching lines are buffered and written every ERROR_LOG_BATCH_LINES lines
+    or ERROR_LOG_FLUSH_INTERVAL seconds rather than flushed one by one.
+    """
     try:
         with open(log_file, 'a', encoding='utf-8') as f:
+            pending = []
+            last_flush = time.monotonic()
+            last_second = None
+            timestamp = ""
             for line in stderr_stream:
                 line = line.strip()
-                if line and ('Permission denied' in line or 'failed' in line.lower() or 'cannot' in line.lower()):
-                    timestamp = datetime.now().strftime("%H:%M:%S")
-                    f.write(f"[{timestamp}] {line}\n")
-                    f.flush()
+                if line and _ERR_RE.search(line):
+                    now_second = int(time.time())
+                    if now_second != last_second:
+                        timestamp = time.strftime("%H:%M:%S", time.localtime(now_second))
+                        last_second = now_second
+                    pending.append(f"[{timestamp}] {line}\n")
+                    now = time.monotonic()
+                    if len(pending) >= ERROR_LOG_BATCH_LINES or now - last_flush >= ERROR_LOG_FLUSH_INTERVAL:
+                        f.writelines(pending)
+                        f.flush()
+                        pending.clear()
+                        last_flush = now
+            f.writelines(pending)
     except Exception:
         pass
 
+def _log_error(log_file, message):
+    """Append one timestamped message to the error log."""
+    try:
+        with open(log_file, 'a', encoding='utf-8') as f:
+            f.write(f"[{time.strftime('%H:%M:%S')}] {message}\n")
+    except OSError:
+        pass
+
+class BackupSizeScanner:
+    """Incrementally total the files created/modified during this backup.
+
+    The tree is walked with os.scandir so each file's size and mtime come from
+    a single DirEntry.stat() (filled in from the directory listing on Windows),
+    and the last seen (inode, mtime, size) of every file is kept between scans
+    so unchanged files are not summed again while a file replaced under the
+    same name is still picked up.
+
+    Directories whose mtime has not moved since the previous scan are not
+    listed again; only their known subdirectories are visited. Files that
+    were still growing on the previous scan are re-stat'ed directly, since
+    appending to a file does not touch its directory's mtime.
+    """
+
+    # Directory mtimes this close to the previous scan may hide a later change
+    # with the same timestamp, so such directories are always listed again.
+    MTIME_SLACK = 2.0
+
+    def __init__(self, backup_location, backup_start_time):
+        self.backup_location = backup_location
+        self.backup_start_time = backup_start_time
+        self.visited_sizes = {}
+        self.total_size = 0
+        self.file_count = 0
+        self._dir_cache = {}
+        self._changing = set()
+        self._last_scan_start = None
+
+    def scan(self):
+        """Rescan the backup tree and update the running totals.
+
+        Returns: (total_size, file_count)
+        """
+        scan_start = time.time()
+        changing = set()
+        pending = deque([self.backup_location])
+        while pending:
+            directory = pending.popleft()
+            try:
+                dir_mtime = os.stat(directory).st_mtime
+            except OSError:
+                continue
+
+            cached = self._dir_cache.get(directory)
+            if (cached and cached[0] == dir_mtime and self._last_scan_start is not None
+                    and dir_mtime < self._last_scan_start - self.MTIME_SLACK):
+                pending.extend(cached[1])
+                continue
+
+            subdirs = []
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                subdirs.append(entry.path)
+                                continue
+                            if entry.name == "backup_errors.log" or not entry.is_file(follow_symlinks=False):
+                                continue
+                            st = entry.stat(follow_symlinks=False)
+                        except OSError:
+                            continue
+                        if self._record(entry.path, st):
+                            changing.add(entry.path)
+            except OSError:
+                continue
+            self._dir_cache[directory] = (dir_mtime, subdirs)
+            pending.extend(subdirs)
+
+        for path in self._changing - changing:
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            if self._record(path, st):
+                changing.add(path)
+
+        self._changing = changing
+        self._last_scan_start = scan_start
+        return self.total_size, self.file_count
+
+    def _record(self, path, st):
+        """Fold one file's stat into the totals; returns True if it changed."""
+        # Only count files written after backup started. adb pull -a restores the
+        # device's mtime, so the inode change (Linux) or creation (Windows) time
+        # is what shows a file was just pulled.
+        if max(st.st_mtime, st.st_ctime) < self.backup_start_time:
+            return False
+        current = (st.st_ino, st.st_mtime, st.st_size)
+        previous = self.visited_sizes.get(path)
+        if previous == current:
+            return False
+        if previous is None:
+            self.file_count += 1
+            self.total_size += st.st_size
+        else:
+            self.total_size += st.st_size - previous[2]
+        self.visited_sizes[path] = current
+        return True
+
 def get_current_backup_size(backup_location, backup_start_time):
     """Get total size of files created/modified during this backup.
     
     Returns: (total_size, file_count)
     """
-    total_size = 0
-    file_count = 0
-    
-    try:
-        for dirpath, _, filenames in os.walk(backup_location):
-            for filename in filenames:
-                if filename == "backup_errors.log":
+    return BackupSizeScanner(backup_location, backup_start_time).scan()
+
+class BackupSizeWatcher:
+    """Keep a running total of the files written into the backup directory.
+
+    On Windows a daemon thread listens to ReadDirectoryChangesW for the whole
+    backup tree and only stats the files named in each change event, so a
+    progress tick reads two counters instead of walking the tree. Files named
+    in adb's progress output are fed in through note_file(). If neither source
+    is available, or the change events stop (ReadDirectoryChangesW fails on
+    some network drives), snapshot() falls back to rescanning with a BackupSizeScanner,
+    at most once every SCAN_INTERVAL seconds, or four times the last scan's
+    duration if that is longer.
+    """
+
+    FILE_LIST_DIRECTORY = 0x0001
+    FILE_SHARE_READ_WRITE_DELETE = 0x0007
+    OPEN_EXISTING = 3
+    FILE_FLAG_BACKUP_SEMANTICS = 0x02000000
+    NOTIFY_FILTER = 0x0001 | 0x0008 | 0x0010  # FILE_NAME | SIZE | LAST_WRITE
+    ACTION_REMOVED = 2
+    ACTION_RENAMED_OLD_NAME = 4
+    BUFFER_SIZE = 64 * 1024
+
+    def __init__(self, backup_location, backup_start_time):
+        self.backup_location = backup_location
+        self.backup_start_time = backup_start_time
+        self.total_bytes = 0
+        self.file_count = 0
+        self._sizes = {}
+        self._lock = threading.Lock()
+        self._handle = None
+        self._kernel32 = None
+        self._stopped = False
+        self._thread = None
+        self._watching = False
+        self._scanner = BackupSizeScanner(backup_location, backup_start_time)
+        self._scan_totals = (0, 0)
+        self._last_scan = None
+        self._scan_interval = SCAN_INTERVAL
+        self._notified = False
+
+    def start(self):
+        """Start watching; returns True if change events are available."""
+        if not sys.platform.startswith('win'):
+            return False
+        try:
+            import ctypes
+            from ctypes import wintypes
+
+            kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+            kernel32.CreateFileW.restype = wintypes.HANDLE
+            kernel32.CreateFileW.argtypes = [
+                wintypes.LPCWSTR, wintypes.DWORD, wintypes.DWORD, wintypes.LPVOID,
+                wintypes.DWORD, wintypes.DWORD, wintypes.HANDLE
+            ]
+            kernel32.ReadDirectoryChangesW.restype = wintypes.BOOL
+            kernel32.ReadDirectoryChangesW.argtypes = [
+                wintypes.HANDLE, wintypes.LPVOID, wintypes.DWORD, wintypes.BOOL,
+                wintypes.DWORD, ctypes.POINTER(wintypes.DWORD), wintypes.LPVOID, wintypes.LPVOID
+            ]
+            kernel32.CancelIoEx.restype = wintypes.BOOL
+            kernel32.CancelIoEx.argtypes = [wintypes.HANDLE, wintypes.LPVOID]
+            kernel32.CloseHandle.restype = wintypes.BOOL
+            kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+
+            handle = kernel32.CreateFileW(
+                self.backup_location,
+                self.FILE_LIST_DIRECTORY,
+                self.FILE_SHARE_READ_WRITE_DELETE,
+                None,
+                self.OPEN_EXISTING,
+                self.FILE_FLAG_BACKUP_SEMANTICS,
+                None
+            )
+            if handle in (None, wintypes.HANDLE(-1).value):
+                return False
+        except Exception:
+            return False
+
+        self._kernel32 = kernel32
+        self._handle = handle
+        self._watching = True
+        self._thread = threading.Thread(target=self._watch_thread, daemon=True)
+        self._thread.start()
+        return True
+
+    def stop(self):
+        """Stop the watcher thread and release the directory handle."""
+        self._stopped = True
+        if self._handle is not None:
+            self._kernel32.CancelIoEx(self._handle, None)
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+
+    def note_file(self, path):
+        """Account for a file the transfer reports as written."""
+        self._notified = True
+        self._update(path)
+
+    def snapshot(self, fresh=False):
+        """Return (total_size, file_count) for files written during this backup.
+
+        When scanning, fresh=True rescans now instead of reusing a recent scan.
+        """
+        if not self._watching and not self._notified:
+            now = time.monotonic()
+            if fresh or self._last_scan is None or now - self._last_scan >= self._scan_interval:
+                self._scan_totals = self._scanner.scan()
+                self._last_scan = now
+                # Keep scanning to at most a quarter of the wall time on large trees
+                self._scan_interval = max(SCAN_INTERVAL, 4 * (time.monotonic() - now))
+            return self._scan_totals
+        with self._lock:
+            return self.total_bytes, self.file_count
+
+    def _watch_thread(self):
+        """Background thread that applies change events to the running totals."""
+        import ctypes
+        from ctypes import wintypes
+
+        buffer = ctypes.create_string_buffer(self.BUFFER_SIZE)
+        bytes_returned = wintypes.DWORD(0)
+        try:
+            while not self._stopped:
+                ok = self._kernel32.ReadDirectoryChangesW(
+                    self._handle,
+                    buffer,
+                    len(buffer),
+                    True,
+                    self.NOTIFY_FILTER,
+                    ctypes.byref(bytes_returned),
+                    None,
+                    None
+                )
+                if not ok:
+                    break
+                if bytes_returned.value == 0:
+                    # The event buffer overflowed, so resync from disk
+                    self._resync()
                     continue
-                filepath = os.path.join(dirpath, filename)
-                try:
-                    mtime = os.path.getmtime(filepath)
-                    # Only count files modified after backup started
-                    if mtime >= backup_start_time:
-                        size = os.path.getsize(filepath)
-                        total_size += size
+                self._apply_events(buffer.raw[:bytes_returned.value])
+        finally:
+            self._kernel32.CloseHandle(self._handle)
+            self._handle = None
+            if not self._stopped:
+                # The watch failed on its own, so let snapshot() scan instead
+                self._watching = False
+
+    def _apply_events(self, data):
+        """Parse FILE_NOTIFY_INFORMATION records and update the touched files."""
+        offset = 0
+        while True:
+            next_offset, action, name_length = struct.unpack_from("<III", data, offset)
+            name = data[offset + 12:offset + 12 + name_length].decode("utf-16-le", "replace")
+            path = os.path.join(self.backup_location, name)
+            if action in (self.ACTION_REMOVED, self.ACTION_RENAMED_OLD_NAME):
+                self._forget(path)
+            else:
+                self._update(path)
+            if not next_offset:
+                break
+            offset += next_offset
+
+    def _update(self, path):
+        if os.path.basename(path) == "backup_errors.log":
+            return
+        try:
+            st = os.stat(path)
+        except OSError:
+            return
+        if stat.S_ISDIR(st.st_mode):
+            return
+        with self._lock:
+            old_size = self._sizes.get(path)
+            if old_size is None:
+                self.file_count += 1
+                old_size = 0
+            self._sizes[path] = st.st_size
+            self.total_bytes += st.st_size - old_size
+
+    def _forget(self, path):
+        with self._lock:
+            old_size = self._sizes.pop(path, None)
+            if old_size is not None:
+                self.file_count -= 1
+                self.total_bytes -= old_size
+
+    def _resync(self):
+        scanner = BackupSizeScanner(self.backup_location, self.backup_start_time)
+        scanner.scan()
+        sizes = {path: size for path, (_, _, size) in scanner.visited_sizes.items()}
+        with self._lock:
+            self._sizes = sizes
+            self.total_bytes = sum(sizes.values())
+            self.file_count = len(sizes)
+
+def build_pull_jobs(device_name, source_path, backup_location, exclude_android):
+    """Split a backup into one adb pull per entry of the source folder.
+
+    A full backup is split on the top-level /sdcard entries (minus Android),
+    a partial backup on the entries of the selected folder. A source with at
+    most one entry, or one that cannot be listed, gets a single job for the
+    whole path. The resulting layout on disk is the same either way.
+
+    Returns: list of (remote_paths, local_dir) jobs
+    """
+    try:
+        if source_path == "/sdcard":
+            entries = list_sdcard(device_name)
+        else:
+            entries = list_remote_dir(device_name, source_path)
+    except Exception:
+        entries = []
+    if exclude_android:
+        entries = [entry for entry in entries if entry != "Android"]
+    if not entries or (len(entries) < 2 and not exclude_android):
+        return [([source_path], backup_location)]
+
+    local_dir = os.path.join(backup_location, os.path.basename(source_path))
+    os.makedirs(local_dir, exist_ok=True)
+    return [([f"{source_path}/{entry}"], local_dir) for entry in entries]
+
+def list_remote_files(device_name, remote_paths):
+    """List every file under the given device paths with its size and mtime.
+
+    Returns: {remote_file: (size_in_bytes, mtime_seconds)}, or None if the
+    listing failed
+    """
+    quoted_paths = " ".join(shlex.quote(path) for path in remote_paths)
+    try:
+        output, exit_code = get_adb_shell(device_name).run(
+            f"find {quoted_paths} -type f -exec stat -c '%s %Y %n' {{}} + 2>/dev/null",
+            timeout=MERGE_LIST_TIMEOUT
+        )
+    except Exception:
+        return None
+    if exit_code != 0:
+        return None
+
+    files = {}
+    for line in output.splitlines():
+        fields = line.split(" ", 2)
+        if len(fields) == 3 and fields[0].isdigit() and fields[1].isdigit():
+            files[fields[2]] = (int(fields[0]), int(fields[1]))
+    return files
+
+def plan_merge_pulls(device_name, source_path, backup_location, exclude_android):
+    """Work out which files a merge into an existing backup still needs.
+
+    Every file under the source is listed on the device with its size and
+    mtime and compared against the copy already in the backup folder. A file
+    is skipped when the local copy has the same size and is not older than
+    the device's file (pulls keep the device mtime, and copies from before
+    that was the case carry their pull time). Everything else is pulled,
+    batched per directory and kept under MAX_PULL_ARGS_LENGTH characters of
+    arguments per adb call.
+
+    Returns: (jobs, total_bytes, skipped_files), or None if the device could
+    not be listed and the whole source should be pulled instead
+    """
+    source_root = source_path.rstrip("/")
+    if exclude_android:
+        try:
+            entries = [entry for entry in list_sdcard(device_name) if entry != "Android"]
+        except Exception:
+            return None
+        roots = [f"{source_root}/{entry}" for entry in entries]
+    else:
+        roots = [source_root]
+    if not roots:
+        return None
+
+    remote_files = list_remote_files(device_name, roots)
+    if remote_files is None:
+        return None
+
+    # The pull for /sdcard/X lands in backup/X, so paths are kept relative to the source's parent
+    parent = source_root.rsplit("/", 1)[0]
+    batches = {}
+    total_bytes = 0
+    skipped_files = 0
+    for remote_file, (size, mtime) in remote_files.items():
+        relative = [part for part in remote_file[len(parent):].split("/") if part]
+        local_path = os.path.join(backup_location, *relative)
+        try:
+            local_stat = os.stat(local_path)
+            if local_stat.st_size == size and int(local_stat.st_mtime) >= mtime:
+                skipped_files += 1
+                continue
+        except OSError:
+            pass
+        batches.setdefault(os.path.dirname(local_path), []).append(remote_file)
+        total_bytes += size
+
+    jobs = []
+    for local_dir, files in batches.items():
+        os.makedirs(local_dir, exist_ok=True)
+        batch = []
+        batch_length = 0
+        for remote_file in files:
+            if batch and batch_length + len(remote_file) + 1 > MAX_PULL_ARGS_LENGTH:
+                jobs.append((batch, local_dir))
+                batch = []
+                batch_length = 0
+            batch.append(remote_file)
+            batch_length += len(remote_file) + 1
+        jobs.append((batch, local_dir))
+    return jobs, total_bytes, skipped_files
+
+class _TrackedStream:
+    """Read-through wrapper that remembers how much was read and the last bytes of it."""
+
+    TAIL_SIZE = 64 * 1024
+
+    def __init__(self, stream):
+        self._stream = stream
+        self.position = 0
+        self._tail = bytearray()
+
+    def read(self, size=-1):
+        data = self._stream.read(size)
+        self.position += len(data)
+        self._tail += data
+        del self._tail[:-self.TAIL_SIZE]
+        return data
+
+    def zero_after(self, offset, min_length):
+        """True if at least min_length bytes were read from offset on, all of them zero."""
+        length = self.position - offset
+        if length < min_length or length > len(self._tail):
+            return False
+        return not self._tail[len(self._tail) - length:].strip(b"\0")
+
+class PullWorkers:
+    """Run adb pull jobs on a small pool of worker threads.
+
+    Each worker takes the next (remote_paths, local_dir) job from a shared
+    queue and runs one adb pull for it, so several transfers overlap their
+    per-file USB round trips instead of waiting on each other. adb's own
+    output is parsed as it streams: per-file progress lines are passed to the
+    size watcher and the final "files pulled" line of each job is totalled.
+
+    With use_tar, a job is first streamed as one tar archive through adb
+    exec-out and extracted member by member as it arrives, which avoids
+    adb pull's per-file protocol round trips. A job that yields no archive
+    (no tar on the device, a single file) falls back to adb pull.
+    """
+
+    def __init__(self, device_name, jobs, error_log_path, workers, size_watcher, pull_flags=(),
+                 use_tar=False):
+        self.device_name = device_name
+        self.pull_flags = list(pull_flags)
+        self.use_tar = use_tar
+        self.error_log_path = error_log_path
+        self.size_watcher = size_watcher
+        self.pulled_bytes = 0
+        self.pulled_files = 0
+        self._job_count = len(jobs)
+        self._reported_jobs = 0
+        self._jobs = queue.Queue()
+        for job in jobs:
+            self._jobs.put(job)
+        self._workers = [
+            threading.Thread(target=self._worker_thread, daemon=True)
+            for _ in range(max(1, min(workers, len(jobs))))
+        ]
+        self._active_workers = len(self._workers)
+        self._finished = threading.Event()
+        self._processes = []
+        self._lock = threading.Lock()
+        self._stopped = False
+
+    def start(self):
+        for worker in self._workers:
+            worker.start()
+
+    def wait(self, timeout):
+        """Block until every job is done or the timeout passes; True when done."""
+        return self._finished.wait(timeout)
+
+    def totals(self):
+        """Return (bytes, files) reported by adb, or None if a job did not report."""
+        with self._lock:
+            if self._reported_jobs < self._job_count:
+                return None
+            return self.pulled_bytes, self.pulled_files
+
+    def terminate(self):
+        """Stop handing out jobs and terminate the running adb pulls.
+
+        Waits for each pull to exit (killing it after PULL_TERMINATE_TIMEOUT
+        seconds) so no adb process still holds files open when the caller
+        goes on to clean up the backup folder.
+        """
+        with self._lock:
+            self._stopped = True
+            processes = list(self._processes)
+            for process in processes:
+                if process.poll() is None:
+                    process.terminate()
+        for process in processes:
+            try:
+                process.wait(timeout=PULL_TERMINATE_TIMEOUT)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+
+    def _worker_thread(self):
+        try:
+            self._run_jobs()
+        finally:
+            with self._lock:
+                self._active_workers -= 1
+                if self._active_workers == 0:
+                    self._finished.set()
+
+    def _run_jobs(self):
+        while not self._stopped:
+            try:
+                remote_paths, local_dir = self._jobs.get_nowait()
+            except queue.Empty:
+                return
+
+            if self.use_tar and self._run_tar(remote_paths, local_dir):
+                continue
+            self._run_pull(remote_paths, local_dir)
+
+    def _spawn(self, command):
+        """Start an adb process for a job; None if stopped or adb failed to start."""
+        with self._lock:
+            if self._stopped:
+                return None
+            try:
+                process = subprocess.Popen(
+                    command,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    **_SUBPROCESS_KW
+                )
+            except OSError as e:
+                _log_error(self.error_log_path, f"adb {command[3]} failed to start: {e}")
+                return None
+            self._processes.append(process)
+            return process
+
+    def _log_stderr(self, process):
+        error_thread = threading.Thread(
+            target=log_errors_thread,
+            args=(io.TextIOWrapper(process.stderr, encoding="utf-8", errors="replace"), self.error_log_path),
+            daemon=True
+        )
+        error_thread.start()
+        return error_thread
+
+    def _run_pull(self, remote_paths, local_dir):
+        process = self._spawn([ADB_PATH, "-s", self.device_name, "pull", "-a", *self.pull_flags, *remote_paths, local_dir])
+        if process is None:
+            return
+        error_thread = self._log_stderr(process)
+        self._read_pull_output(process.stdout, remote_paths, local_dir)
+        process.wait()
+        error_thread.join()
+
+    def _run_tar(self, remote_paths, local_dir):
+        """Stream a job as a tar archive; False if adb pull should do it instead."""
+        if len(remote_paths) == 1:
+            # A single folder is archived from inside so a symlinked root like /sdcard is followed
+            remote_root = remote_paths[0].rstrip("/")
+            tar_dir, names = remote_root, ["."]
+            extract_dir = os.path.join(local_dir, os.path.basename(remote_root))
+        else:
+            parents = {path.rstrip("/").rsplit("/", 1)[0] for path in remote_paths}
+            if len(parents) != 1:
+                return False
+            tar_dir = parents.pop() or "/"
+            names = [path.rstrip("/").rsplit("/", 1)[1] for path in remote_paths]
+            extract_dir = local_dir
+
+        command = f"tar -cf - -C {shlex.quote(tar_dir)} {' '.join(shlex.quote(name) for name in names)} 2>/dev/null"
+        process = self._spawn([ADB_PATH, "-s", self.device_name, "exec-out", command])
+        if process is None:
+            return True
+        error_thread = self._log_stderr(process)
+        extracted, complete, file_count, byte_count = self._read_tar_stream(process.stdout, extract_dir)
+        process.wait()
+        error_thread.join()
+        if self._stopped:
+            return True
+        if not extracted:
+            return False
+        if not complete:
+            _log_error(
+                self.error_log_path,
+                f"tar transfer failed for {' '.join(remote_paths)} (archive truncated or corrupt), retrying with adb pull"
+            )
+            return False
+        with self._lock:
+            self.pulled_files += file_count
+            self.pulled_bytes += byte_count
+            self._reported_jobs += 1
+        return True
+
+    def _read_tar_stream(self, stdout_stream, extract_dir):
+        """Extract a tar stream as it arrives, noting each file written.
+
+        tarfile stops iterating quietly at a damaged header, so the archive
+        only counts as complete if everything after the last member is zero
+        padding (the end-of-archive blocks). The rest of the stream is always
+        drained so adb never blocks writing into a full pipe.
+
+        Returns: (members_extracted, complete, file_count, byte_count)
+        """
+        import tarfile
+
+        # The "data" filter refuses absolute paths and links leaving extract_dir
+        extract_kwargs = {'filter': 'data'} if hasattr(tarfile, 'data_filter') else {}
+        stream = _TrackedStream(stdout_stream)
+        extracted = 0
+        file_count = 0
+        byte_count = 0
+        complete = False
+        try:
+            with tarfile.open(fileobj=stream, mode="r|") as archive:
+                for member in archive:
+                    try:
+                        archive.extract(member, extract_dir, **extract_kwargs)
+                    except (OSError, tarfile.TarError) as e:
+                        _log_error(self.error_log_path, f"tar extract failed for {member.name}: {e}")
+                        continue
+                    extracted += 1
+                    if member.isfile():
+                        self.size_watcher.note_file(os.path.normpath(os.path.join(extract_dir, member.name)))
                         file_count += 1
-                except (FileNotFoundError, PermissionError, OSError):
-                    continue
-    except (FileNotFoundError, PermissionError):
-        pass
-    
-    return total_size, file_count
+                        byte_count += member.size
+                complete = stream.zero_after(archive.offset, min_length=tarfile.BLOCKSIZE)
+        except tarfile.TarError:
+            # An empty stream (tar missing on the device) is not an archive
+            pass
+
+        for chunk in iter(lambda: stdout_stream.read(_TrackedStream.TAIL_SIZE), b""):
+            if chunk.strip(b"\0"):
+                complete = False
+        return extracted, complete, file_count, byte_count
+
+    def _read_pull_output(self, stdout_stream, remote_paths, local_dir):
+        """Follow adb pull's stdout, noting each file as adb moves past it.
+
+        The stream is read as raw bytes; only the file name of a matched
+        progress line is decoded. The file still being written is also
+        re-noted every PROGRESS_INTERVAL seconds so a single large file shows
+        progress while it transfers.
+        """
+        current_file = None
+        last_note = 0.0
+        for line in stdout_stream:
+            line = line.strip()
+            progress_match = _ADB_PROGRESS_RE.match(line)
+            if progress_match:
+                remote_file = progress_match.group(2).decode("utf-8", "replace")
+                local_path = self._local_path(remote_file, remote_paths, local_dir)
+                if local_path != current_file:
+                    if current_file:
+                        self.size_watcher.note_file(current_file)
+                    current_file = local_path
+                    last_note = 0.0
+                now = time.monotonic()
+                if current_file and now - last_note >= PROGRESS_INTERVAL:
+                    self.size_watcher.note_file(current_file)
+                    last_note = now
+                continue
+            summary_match = _ADB_PULL_SUMMARY_RE.search(line)
+            if summary_match:
+                with self._lock:
+                    self.pulled_files += int(summary_match.group(1))
+                    self.pulled_bytes += int(summary_match.group(2))
+                    self._reported_jobs += 1
+        if current_file:
+            self.size_watcher.note_file(current_file)
+
+    @staticmethod
+    def _local_path(remote_file, remote_paths, local_dir):
+        """Map a remote file named by adb to where the pull writes it locally."""
+        for remote_path in remote_paths:
+            remote_root = remote_path.rstrip("/")
+            if remote_file == remote_root:
+                return os.path.join(local_dir, os.path.basename(remote_root))
+            if remote_file.startswith(remote_root + "/"):
+                relative = remote_file[len(remote_root) + 1:]
+                return os.path.join(local_dir, os.path.basename(remote_root), *relative.split("/"))
+        return None
 
-def perform_backup_with_progress(device_name, source_path, backup_location, total_size, exclude_android):
+def write_completion_file(backup_location, device_name, details, exclude_android):
+    """Record a finished backup run in backup_completed.txt.
+
+    The first line carries the date check_existing_backup shows next time.
+    """
+    timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+    try:
+        with open(os.path.join(backup_location, "backup_completed.txt"), "w") as f:
+            f.write(f"Backup completed on {timestamp}\n")
+            f.write(f"Device: {device_name}\n")
+            for line in details:
+                f.write(f"{line}\n")
+            if exclude_android:
+                f.write(f"Note: Android folder was excluded due to permission restrictions\n")
+    except Exception as e:
+        print(f"{Fore.YELLOW}Warning: Could not create completion file: {e}{Style.RESET_ALL}")
+
+def perform_backup_with_progress(device_name, source_path, backup_location, total_size, exclude_android,
+                                 parallel_pulls=DEFAULT_PARALLEL_PULLS, verified=False, jobs=None,
+                                 pull_flags=(), use_tar=False):
     """Execute the backup with real-time progress tracking.
     
+    Pass verified=True when source_path is already known to exist on the
+    device to skip the check. jobs overrides the pull jobs that would
+    otherwise be built from source_path (see plan_merge_pulls). pull_flags
+    are extra adb pull options (see get_pull_flags); use_tar streams each
+    job as a tar archive instead where the device allows it.
+
     Returns: True if successful, False otherwise
     """
     start_time = time.time()
     error_log_path = os.path.join(backup_location, "backup_errors.log")
     
-    try:
-        result = subprocess.run(
-            [ADB_PATH, "-s", device_name, "shell", f"test -d {source_path} && echo exists"],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        if "exists" not in result.stdout:
-            print(f"{Fore.RED}Error: Source path {source_path} not found on device{Style.RESET_ALL}")
+    if not verified:
+        try:
+            _, exit_code = get_adb_shell(device_name).run(f"test -d {shlex.quote(source_path)}", timeout=5)
+            if exit_code != 0:
+                print(f"{Fore.RED}Error: Source path {source_path} not found on device{Style.RESET_ALL}")
+                input("Press Enter to exit...")
+                return False
+        except Exception as e:
+            print(f"{Fore.RED}Error verifying source path: {e}{Style.RESET_ALL}")
             input("Press Enter to exit...")
             return False
-    except Exception as e:
-        print(f"{Fore.RED}Error verifying source path: {e}{Style.RESET_ALL}")
-        input("Press Enter to exit...")
-        return False
 
     print("-" * 60)
     print("")
     
-    cmd = [ADB_PATH, "-s", device_name, "pull", source_path, backup_location]
-    
-    process = subprocess.Popen(
-        cmd,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,
-        encoding="utf-8",
-    )
-    
-    error_thread = threading.Thread(
-        target=log_errors_thread,
-        args=(process.stderr, error_log_path),
-        daemon=True
-    )
-    error_thread.start()
+    size_watcher = BackupSizeWatcher(backup_location, start_time)
+    size_watcher.start()
+
+    merging = jobs is not None
+    if jobs is None:
+        jobs = build_pull_jobs(device_name, source_path, backup_location, exclude_android)
+    pulls = PullWorkers(device_name, jobs, error_log_path, parallel_pulls, size_watcher, pull_flags, use_tar)
+    pulls.start()
     
     last_size = 0
     last_update_time = start_time
-    transfer_rate = 0
-    rate_samples = []
-    max_samples = 5
+    transfer_rate = None
+    total_str = format_size(total_size)
+    last_redraw_key = None
+    last_redraw_time = 0.0
     
     try:
         while True:
-            time.sleep(1)
+            finished = pulls.wait(PROGRESS_INTERVAL)
             
-            current_size, file_count = get_current_backup_size(backup_location, start_time)
+            # The final frame shows adb's own totals, or at least a scan taken after the last pull
+            pulled_totals = pulls.totals() if finished else None
+            if pulled_totals:
+                current_size, file_count = pulled_totals
+            else:
+                current_size, file_count = size_watcher.snapshot(fresh=finished)
             
-            progress = min((current_size / total_size) * 100, 100.0)
+            # A merge of only empty files has nothing to measure against
+            progress = min((current_size / total_size) * 100, 100.0) if total_size > 0 else 100.0
             current_time = time.time()
             elapsed_time = current_time - start_time
             time_diff = current_time - last_update_time
@@ -478,35 +1551,47 @@ def perform_backup_with_progress(device_name, source_path, backup_location, tota
             if time_diff >= 1 and current_size >= last_size:
                 size_diff = current_size - last_size
                 instant_rate = size_diff / time_diff
-                rate_samples.append(instant_rate)
-                
-                if len(rate_samples) > max_samples:
-                    rate_samples.pop(0)
-                
-                transfer_rate = sum(rate_samples) / len(rate_samples)
+                if transfer_rate is None:
+                    transfer_rate = instant_rate
+                else:
+                    alpha = 1 - math.exp(-time_diff / RATE_TIME_CONSTANT)
+                    transfer_rate += alpha * (instant_rate - transfer_rate)
                 last_size = current_size
                 last_update_time = current_time
 
 
-            progress_bar = draw_progress_bar(progress, width=30)
-            status = (
-                f"\r{Fore.CYAN}{progress_bar} "
-                f"{format_size(current_size)}/{format_size(total_size)} "
-                f"({file_count} files) "
-                f"[{format_size(transfer_rate)}/s]{Style.RESET_ALL}"
-            )
-
-
-            
-            print(status, end='', flush=True)
+            # Console writes are slow on Windows, so redraw at most every REDRAW_INTERVAL
+            # seconds and only once the bar, the rate or the file count has moved
+            redraw_key = (round(progress * 10), int((transfer_rate or 0) / _KB), file_count)
+            if redraw_key != last_redraw_key and (
+                    finished or current_time - last_redraw_time >= REDRAW_INTERVAL):
+                progress_bar = draw_progress_bar(progress, width=30)
+                status = (
+                    f"{_PROGRESS_PREFIX}{progress_bar} "
+                    f"{format_size(current_size)}/{total_str} "
+                    f"({file_count} files) "
+                    f"[{format_size(transfer_rate or 0)}/s]{_RESET}"
+                )
+                sys.stdout.write(status)
+                sys.stdout.flush()
+                last_redraw_key = redraw_key
+                last_redraw_time = current_time
 
-            if process.poll() is not None:
+            if finished:
                 break
 
-        current_size, file_count = get_current_backup_size(backup_location, start_time)
+        size_watcher.stop()
+        pulled_totals = pulls.totals()
+        if pulled_totals:
+            # Every job reported a finished transfer, even if its files were all empty
+            current_size, file_count = pulled_totals
+            succeeded = True
+        else:
+            current_size, file_count = get_current_backup_size(backup_location, start_time)
+            succeeded = file_count > 0
         print()
         
-        if current_size > 0:
+        if succeeded:
             end_time = time.time()
             total_time = end_time - start_time
             print(f"\n{Fore.GREEN}Backup completed successfully!{Style.RESET_ALL}")
@@ -523,18 +1608,13 @@ def perform_backup_with_progress(device_name, source_path, backup_location, tota
             if os.path.exists(error_log_path) and os.path.getsize(error_log_path) > 0:
                 print(f"{Fore.YELLOW} - Some files were skipped - see backup_errors.log for details{Style.RESET_ALL}")
             
-            timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-            try:
-                with open(os.path.join(backup_location, "backup_completed.txt"), "w") as f:
-                    f.write(f"Backup completed on {timestamp}\n")
-                    f.write(f"Device: {device_name}\n")
-                    f.write(f"Total files: {file_count}\n")
-                    f.write(f"Total size: {format_size(current_size)}\n")
-                    f.write(f"Elapsed time: {format_time(total_time)}\n")
-                    if exclude_android:
-                        f.write(f"Note: Android folder was excluded due to permission restrictions\n")
-            except Exception as e:
-                print(f"{Fore.YELLOW}Warning: Could not create completion file: {e}{Style.RESET_ALL}")
+            if merging:
+                # A merge only pulls what changed, so its totals cover this run alone
+                details = [f"Files pulled this run: {file_count}", f"Size pulled this run: {format_size(current_size)}"]
+            else:
+                details = [f"Total files: {file_count}", f"Total size: {format_size(current_size)}"]
+            details.append(f"Elapsed time: {format_time(total_time)}")
+            write_completion_file(backup_location, device_name, details, exclude_android)
             
             print("")
             input("Backup complete! Press Enter to exit...")
@@ -547,13 +1627,15 @@ def perform_backup_with_progress(device_name, source_path, backup_location, tota
             
     except KeyboardInterrupt:
         print(f"\n{Fore.YELLOW}Backup interrupted by user.{Style.RESET_ALL}")
-        if process and process.poll() is None:
-            process.terminate()
+        size_watcher.stop()
+        pulls.terminate()
         print("")
         input("Press Enter to exit...")
         return False
 
-def copy_files_from_android(device_name, backup_location, dir_created_by_us):
+def copy_files_from_android(device_name, backup_location, dir_created_by_us,
+                            parallel_pulls=DEFAULT_PARALLEL_PULLS, merge=False, pull_flags=(),
+                            use_tar=False):
     """Main backup orchestration function."""
     try:
         if not check_device_compatibility(device_name):
@@ -561,18 +1643,44 @@ def copy_files_from_android(device_name, backup_location, dir_created_by_us):
             input("Press Enter to exit...")
             return
 
-        source_path, exclude_android = get_backup_parameters(device_name)
+        source_path, exclude_android, source_verified = get_backup_parameters(device_name)
         if not source_path:
             return
         
-        total_size = estimate_backup_size()
+        jobs = None
+        if merge:
+            # A merge totals what is left to pull from its own file listing
+            cancel_prefetch(device_name)
+        merge_plan = plan_merge_pulls(device_name, source_path, backup_location, exclude_android) if merge else None
+        if merge_plan is not None:
+            jobs, total_size, skipped_files = merge_plan
+            print(f"\n{Fore.GREEN}Merge:{Style.RESET_ALL} {skipped_files} files already backed up, "
+                  f"{format_size(total_size)} left to pull")
+            if not jobs:
+                print(f"{Fore.GREEN}Existing backup is already up to date.{Style.RESET_ALL}")
+                write_completion_file(
+                    backup_location, device_name,
+                    ["Files pulled this run: 0", f"Files already backed up: {skipped_files}"],
+                    exclude_android
+                )
+                input("Press Enter to exit...")
+                return
+        else:
+            if merge:
+                print(f"{Fore.YELLOW}Could not list files on the device; pulling everything.{Style.RESET_ALL}")
+            total_size = estimate_backup_size(device_name, source_path)
         
         success = perform_backup_with_progress(
             device_name,
             source_path,
             backup_location,
             total_size,
-            exclude_android
+            exclude_android,
+            parallel_pulls,
+            source_verified,
+            jobs,
+            pull_flags,
+            use_tar
         )
         
         if not success and dir_created_by_us:
@@ -584,63 +1692,118 @@ def copy_files_from_android(device_name, backup_location, dir_created_by_us):
         input("Press Enter to exit...")
         return
 
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+_SIZE_DIVISORS = tuple(1024 ** i for i in range(len(_SIZE_UNITS)))
+
 def format_size(size_bytes):
     """Format bytes to human-readable size."""
-    if size_bytes < 1024:
+    size_bytes = int(size_bytes)
+    unit = min(max((size_bytes.bit_length() - 1) // 10, 0), len(_SIZE_UNITS) - 1)
+    if unit == 0:
         return f"{size_bytes} B"
-    elif size_bytes < 1024 * 1024:
-        return f"{size_bytes/1024:.2f} KB"
-    elif size_bytes < 1024 * 1024 * 1024:
-        return f"{size_bytes/(1024*1024):.2f} MB"
-    else:
-        return f"{size_bytes/(1024*1024*1024):.2f} GB"
+    return f"{size_bytes / _SIZE_DIVISORS[unit]:.2f} {_SIZE_UNITS[unit]}"
 
 def format_time(seconds):
     """Format seconds to human-readable time (HH:MM:SS)."""
-    if seconds < 0:
-        seconds = 0
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
+    hours, secs = divmod(max(int(seconds), 0), 3600)
+    minutes, secs = divmod(secs, 60)
     return f"{hours:02d}:{minutes:02d}:{secs:02d}"
 
+_BAR_FULL = '█' * 100
+_BAR_EMPTY = '░' * 100
+
+@functools.lru_cache(maxsize=1001)
+def _progress_bar(tenths, width):
+    filled_width = width * tenths // 1000
+    return f"[{_BAR_FULL[:filled_width]}{_BAR_EMPTY[:width - filled_width]}] {tenths / 10:.1f}%"
+
 def draw_progress_bar(progress, width=30):
     """Draw a progress bar with the given progress percentage."""
-    filled_width = int(width * progress / 100)
-    bar = '█' * filled_width + '░' * (width - filled_width)
-    return f"[{bar}] {progress:.1f}%"
+    return _progress_bar(round(progress * 10), width)
+
+_CONFIG_CACHE = {}
 
 def load_config():
-    """Load configuration file if it exists, otherwise return default config."""
-    config_path = os.path.join(CURRENT_DIR, "android_archiver.cfg")
-    config = configparser.ConfigParser()
+    """Load configuration file if it exists, otherwise return default config.
 
+    The file is read with a single regex over its "key = value" lines rather
+    than configparser; only the [DEFAULT] section is ever written. Returns
+    the settings as a plain dict. The parsed file is cached and reused until
+    its modification time changes.
+    """
+    config_path = os.path.join(CURRENT_DIR, "android_archiver.cfg")
     try:
-        if os.path.exists(config_path):
-            config.read(config_path)
-            if 'DEFAULT' in config and 'backup_location' in config['DEFAULT']:
-                config['DEFAULT']['backup_location'] = os.path.expandvars(config['DEFAULT']['backup_location'])
-            return config
+        config_mtime = os.path.getmtime(config_path)
+    except OSError:
+        config_mtime = None
 
-        config['DEFAULT'] = {
+    cached = _CONFIG_CACHE.get(config_path)
+    if cached is not None and config_mtime is not None and cached[0] == config_mtime:
+        return dict(cached[1])
+
+    try:
+        if config_mtime is not None:
+            with open(config_path, encoding='utf-8') as configfile:
+                settings = {key.lower(): value for key, value in _CONFIG_LINE_RE.findall(configfile.read())}
+            if 'backup_location' in settings:
+                settings['backup_location'] = os.path.expandvars(settings['backup_location'])
+            _CONFIG_CACHE[config_path] = (config_mtime, settings)
+            return dict(settings)
+
+        settings = {
             'backup_location': os.path.join(
                 os.path.expanduser("~"),
                 "Documents",
                 "AndroidBackup"
-            )
+            ),
+            'parallel_pulls': str(DEFAULT_PARALLEL_PULLS),
+            'compress_pulls': 'yes',
+            'transfer_mode': 'pull'
         }
         
         try:
-            with open(config_path, 'w') as configfile:
-                config.write(configfile)
+            with open(config_path, 'w', encoding='utf-8') as configfile:
+                configfile.write("[DEFAULT]\n")
+                configfile.writelines(f"{key} = {value}\n" for key, value in settings.items())
         except Exception as e:
             print(f"{Fore.YELLOW}Warning: Could not create config file: {e}{Style.RESET_ALL}")
         
-        return config
+        return settings
 
     except Exception as e:
         print(f"{Fore.YELLOW}Warning: Error loading config: {e}. Using defaults.{Style.RESET_ALL}")
-        return config
+        return {}
+
+def get_parallel_pulls(config):
+    """Read how many adb pulls may run at once; 1 pulls serially."""
+    try:
+        return max(1, int(config.get('parallel_pulls', DEFAULT_PARALLEL_PULLS)))
+    except ValueError:
+        print(f"{Fore.YELLOW}Warning: Invalid parallel_pulls in config. Using {DEFAULT_PARALLEL_PULLS}.{Style.RESET_ALL}")
+        return DEFAULT_PARALLEL_PULLS
+
+def get_pull_flags(config):
+    """Build the adb pull compression flags from the compress_pulls setting.
+
+    adb pull already compresses by default wherever it supports compression,
+    so only compress_pulls = no adds a flag (-Z). adb builds older than
+    ADB_COMPRESSION_MIN_VERSION have no such flag and never compress.
+    """
+    setting = config.get('compress_pulls', 'yes').strip().lower()
+    if setting in ('no', 'false', 'off', '0'):
+        if _ADB_VERSION is None or _ADB_VERSION < ADB_COMPRESSION_MIN_VERSION:
+            return []
+        return ["-Z"]
+    if setting not in ('yes', 'true', 'on', '1'):
+        print(f"{Fore.YELLOW}Warning: Invalid compress_pulls in config. Using yes.{Style.RESET_ALL}")
+    return []
+
+def get_use_tar(config):
+    """Read whether transfers should stream through tar (transfer_mode = tar)."""
+    mode = config.get('transfer_mode', 'pull').strip().lower()
+    if mode not in ('pull', 'tar'):
+        print(f"{Fore.YELLOW}Warning: Invalid transfer_mode in config. Using pull.{Style.RESET_ALL}")
+    return mode == 'tar'
 
 def main():
     print(f"{Fore.GREEN}{'='*60}{Style.RESET_ALL}")
@@ -657,33 +1820,42 @@ def main():
         if not device_name:
             return
 
-        config = load_config()
-        backup_location = select_backup_location(config)
-        if not backup_location:
-            input("Press Enter to exit...")
-            return
-
-        dir_created_by_us = False
-        if not os.path.exists(backup_location):
-            try:
-                os.makedirs(backup_location)
-                dir_created_by_us = True
-            except Exception as e:
-                print(f"{Fore.RED}Failed to create backup directory: {e}{Style.RESET_ALL}")
-                input("Press Enter to exit...")
-                return
-        else:
-            if not check_existing_backup(backup_location):
-                print(f"{Fore.YELLOW}Backup cancelled. Please restart and choose a different location.{Style.RESET_ALL}")
+        with get_adb_shell(device_name):
+            config = load_config()
+            backup_location = select_backup_location(config)
+            if not backup_location:
                 input("Press Enter to exit...")
                 return
 
-        copy_files_from_android(device_name, backup_location, dir_created_by_us)
+            dir_created_by_us = False
+            merge = False
+            if not os.path.exists(backup_location):
+                try:
+                    os.makedirs(backup_location)
+                    dir_created_by_us = True
+                except Exception as e:
+                    print(f"{Fore.RED}Failed to create backup directory: {e}{Style.RESET_ALL}")
+                    input("Press Enter to exit...")
+                    return
+            else:
+                proceed, merge = check_existing_backup(backup_location)
+                if not proceed:
+                    print(f"{Fore.YELLOW}Backup cancelled. Please restart and choose a different location.{Style.RESET_ALL}")
+                    input("Press Enter to exit...")
+                    return
+
+            copy_files_from_android(device_name, backup_location, dir_created_by_us,
+                                    get_parallel_pulls(config), merge, get_pull_flags(config),
+                                    get_use_tar(config))
 
     except Exception as e:
         print(f"{Fore.RED}Unexpected error: {e}{Style.RESET_ALL}")
         print("")
         input("Press Enter to exit...")
+    finally:
+        # The prefetch thread would otherwise keep the process alive until du finishes
+        for prefetched_device in list(_PREFETCH_SHELLS):
+            cancel_prefetch(prefetched_device)
 
 if __name__ == "__main__":
     main()
@@ -2,6 +2,7 @@ import os
 import sys
 import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 
 print("=" * 31)
 print("Android Archiver - Build Script")
@@ -10,6 +11,8 @@ print("=" * 31)
 SCRIPT_NAME = "Android-Archiver.py"
 ICO_FILE = "icon.ico"
 OUTPUT_NAME = "Android Archiver"
+# build/ keeps PyInstaller's analysis between runs; pass --clean to start from scratch
+CLEAN_BUILD = "--clean" in sys.argv[1:]
 
 if not os.path.exists(SCRIPT_NAME):
     print(f"Error: {SCRIPT_NAME} not found!")
@@ -49,16 +52,22 @@ except (subprocess.CalledProcessError, FileNotFoundError):
         input("Press Enter to exit...")
         sys.exit(1)
 
-print("\nCleaning previous build files...")
-for folder in ["build", "dist", "__pycache__"]:
-    if os.path.exists(folder):
-        shutil.rmtree(folder)
-        print(f"  Removed {folder}/")
+def remove_build_artifact(name):
+    if name.endswith(".spec"):
+        os.remove(name)
+        return name
+    shutil.rmtree(name, ignore_errors=True)
+    return f"{name}/"
 
-spec_files = [f for f in os.listdir(".") if f.endswith(".spec")]
-for spec in spec_files:
-    os.remove(spec)
-    print(f"  Removed {spec}")
+print("\nCleaning previous build files...")
+clean_folders = ("build", "dist", "__pycache__") if CLEAN_BUILD else ("dist", "__pycache__")
+stale = [
+    name for name in os.listdir(".")
+    if name in clean_folders or name.endswith(".spec")
+]
+with ThreadPoolExecutor(max_workers=4) as executor:
+    for removed in executor.map(remove_build_artifact, stale):
+        print(f"  Removed {removed}")
 
 print("\nBuilding executable...")
 
@@ -67,8 +76,18 @@ cmd = [
     "--onefile",
     "--console",
     "--name", OUTPUT_NAME,
+    "--workpath", "build",
+    "--distpath", "dist",
+    "--noconfirm",
 ]
 
+# Stdlib modules the archiver never imports; keeping them out shrinks the bundle
+for module in ("unittest", "pydoc", "doctest"):
+    cmd.extend(["--exclude-module", module])
+
+if CLEAN_BUILD:
+    cmd.append("--clean")
+
 if use_icon:
     cmd.extend(["--icon", ICO_FILE])
 